@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.14"
-# dependencies = ["typer>=0.21.0", "jsonschema>=4.23"]
+# dependencies = ["typer>=0.21.0", "jsonschema>=4.23", "orjson>=3.10"]
 # ///
 
 from bootstrap import app
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import json
 import platform
-import socket
 import subprocess
-from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
 
@@ -12,23 +12,31 @@ from .defaults import (
     DefaultEntry,
     ReadStatus,
     format_write_value,
+    load_defaults_by_category,
     load_defaults_entries,
     parse_default_value,
+    prefetch_domains,
     read_default,
-    run_defaults_cmd,
     values_equal,
+    write_default,
+)
+from .deps import (
+    KIND_PREDICATE,
+    DepCheck,
+    clear_predicate_caches,
+    load_dep_checks,
+    load_dep_required_by,
 )
-from .deps import KIND_PREDICATE, load_dep_checks
 from .git import verify_gpg_signing, verify_ssh_keys
 from .symlinks import (
     ReplaceMode,
+    compute_statuses,
     confirm_mode,
     link_items,
     load_link_items,
     print_status,
     resolve_items,
     status_label,
-    status_of,
 )
 from .launchd import (
     _plist_path,
@@ -41,7 +49,17 @@ from .launchd import (
     load_job_entries,
     write_plist,
 )
-from .utils import console, display_path, repo_root, require_darwin
+from .utils import (
+    DEFAULTS_JSON,
+    REPO_ROOT,
+    SCRIPTS_DIR,
+    SectionResult,
+    display_path,
+    file_contains,
+    get_console,
+    json_loads,
+    require_darwin,
+)
 from .validation import (
     check_hardcoded_paths,
     check_json_formatting,
@@ -77,271 +95,273 @@ def status() -> None:
     print_status(load_link_items())
 
 
-@app.command()
-def verify() -> None:
-    """Run all verification checks on your environment."""
+def _check_symlinks() -> SectionResult:
+    lines: list[str] = []
     ok = fail = 0
-
-    # 1. Symlink health
-    console.rule("[bold]Symlink health[/bold]", align="left", style="dim")
-    for item in load_link_items():
-        st, detail = status_of(item)
+    items = load_link_items()
+    statuses = compute_statuses(items)
+    for item in items:
+        st, detail = statuses[item.key]
         if st == "linked":
-            console.print(f"[green]OK[/green]      {item.key}")
+            lines.append(f"[green]OK[/green]      {item.key}")
             ok += 1
         else:
             label = status_label(st)
-            console.print(f"[red]FAIL[/red]    {item.key} - {label}: {detail}")
+            lines.append(f"[red]FAIL[/red]    {item.key} - {label}: {detail}")
             fail += 1
-    console.print()
+    return lines, ok, fail
 
-    # 2. Dependencies
-    console.rule("[bold]Dependencies[/bold]", align="left", style="dim")
+
+def _check_dependencies() -> SectionResult:
+    lines: list[str] = []
+    ok = fail = 0
+    clear_predicate_caches()
+    required_by = load_dep_required_by()
     checks = load_dep_checks()
 
-    # Build reverse dependency map: label -> list of labels that depend on it
-    required_by: dict[str, list[str]] = defaultdict(list)
-    for check in checks:
-        for dep in check.get("depends", []):
-            required_by[dep].append(check["label"])
+    def probe(check: DepCheck) -> bool:
+        predicate = KIND_PREDICATE.get(check.kind)
+        return bool(predicate and predicate(check.target))
 
-    for check in sorted(checks, key=lambda c: c["label"].casefold()):
-        label = check["label"]
-        kind = check["kind"]
-        target = check["target"]
+    # which/isdir/isfile are stat-bound and release the GIL, so probe
+    # concurrently and report in the presorted label order.
+    with ThreadPoolExecutor(max_workers=min(32, len(checks) or 1)) as pool:
+        present = list(pool.map(probe, checks))
 
-        predicate = KIND_PREDICATE.get(kind)
-        if predicate and predicate(target):
-            console.print(f"[green]OK[/green]      {label} - {kind}: {target}")
+    for check, found in zip(checks, present):
+        label = check.label
+        kind = check.kind
+        target = check.target
+
+        if found:
+            lines.append(f"[green]OK[/green]      {label} - {kind}: {target}")
             ok += 1
         else:
             hints: list[str] = []
             if label in required_by:
-                deps = ", ".join(sorted(required_by[label]))
+                deps = ", ".join(required_by[label])
                 hints.append(f"required by: {deps}")
-            install_url = check.get("install")
-            if install_url:
-                hints.append(f"install: {install_url}")
+            if check.install:
+                hints.append(f"install: {check.install}")
             hint = f" ({', '.join(hints)})" if hints else ""
-            console.print(f"[red]MISSING[/red] {label} - {kind}: {target}{hint}")
+            lines.append(f"[red]MISSING[/red] {label} - {kind}: {target}{hint}")
             fail += 1
 
-        for note in check.get("notes", []):
-            console.print(f"        [yellow]note:[/yellow] [dim]{note}[/dim]")
-    console.print()
+        for note in check.notes:
+            lines.append(f"        [yellow]note:[/yellow] [dim]{note}[/dim]")
+    return lines, ok, fail
 
-    # 3. JSON schema validation
-    console.rule("[bold]JSON schema validation[/bold]", align="left", style="dim")
-    schema_errors = validate_deps_schema()
-    if schema_errors:
-        for err in schema_errors:
-            console.print(f"[red]FAIL[/red]    {err}")
-            fail += 1
-    else:
-        console.print("[green]OK[/green]      scripts/deps.json")
-        ok += 1
-
-    defaults_schema_errors = validate_defaults_schema()
-    if defaults_schema_errors:
-        for err in defaults_schema_errors:
-            console.print(f"[red]FAIL[/red]    {err}")
-            fail += 1
-    else:
-        console.print("[green]OK[/green]      scripts/macos-defaults.json")
-        ok += 1
 
-    links_schema_errors = validate_links_schema()
-    if links_schema_errors:
-        for err in links_schema_errors:
-            console.print(f"[red]FAIL[/red]    {err}")
-            fail += 1
-    else:
-        console.print("[green]OK[/green]      scripts/links.json")
-        ok += 1
+def _check_schemas() -> SectionResult:
+    lines: list[str] = []
+    ok = fail = 0
+    for name, validate in (
+        ("scripts/deps.json", validate_deps_schema),
+        ("scripts/macos-defaults.json", validate_defaults_schema),
+        ("scripts/links.json", validate_links_schema),
+        ("scripts/jobs.json", validate_jobs_schema),
+    ):
+        errors = validate()
+        if errors:
+            for err in errors:
+                lines.append(f"[red]FAIL[/red]    {err}")
+                fail += 1
+        else:
+            lines.append(f"[green]OK[/green]      {name}")
+            ok += 1
+    return lines, ok, fail
 
-    jobs_schema_errors = validate_jobs_schema()
-    if jobs_schema_errors:
-        for err in jobs_schema_errors:
-            console.print(f"[red]FAIL[/red]    {err}")
-            fail += 1
-    else:
-        console.print("[green]OK[/green]      scripts/jobs.json")
-        ok += 1
-    console.print()
 
-    # 4. JSON formatting
-    console.rule("[bold]JSON formatting[/bold]", align="left", style="dim")
+def _check_formatting() -> SectionResult:
+    lines: list[str] = []
+    ok = fail = 0
     for json_name in ("deps.json", "macos-defaults.json", "links.json", "jobs.json"):
-        json_file = repo_root() / "scripts" / json_name
+        json_file = SCRIPTS_DIR / json_name
         if check_json_formatting(json_file):
-            console.print(f"[green]OK[/green]      scripts/{json_name}")
+            lines.append(f"[green]OK[/green]      scripts/{json_name}")
             ok += 1
         else:
-            console.print(
+            lines.append(
                 f"[red]FAIL[/red]    scripts/{json_name} not formatted"
                 " (run: python3 -m json.tool --indent 2)"
             )
             fail += 1
-    console.print()
-
-    # 5. Hardcoded home paths
-    console.rule("[bold]Hardcoded home paths[/bold]", align="left", style="dim")
-    violations = check_hardcoded_paths(repo_root() / ".zshrc")
-    if violations:
-        for lineno, line in violations:
-            console.print(f"[red]FAIL[/red]    .zshrc:{lineno}: {line}")
-            fail += 1
-    else:
-        console.print("[green]OK[/green]      No hardcoded paths found")
-        ok += 1
-    console.print()
-
-    # 6. GPG signing
-    console.rule("[bold]GPG signing[/bold]", align="left", style="dim")
-    gpg_ok, gpg_fail = verify_gpg_signing()
-    ok += gpg_ok
-    fail += gpg_fail
-    console.print()
-
-    # 7. SSH keys
-    console.rule("[bold]SSH keys[/bold]", align="left", style="dim")
-    ssh_ok, ssh_fail = verify_ssh_keys()
-    ok += ssh_ok
-    fail += ssh_fail
-    console.print()
-
-    # 8. Keychain hygiene
-    console.rule("[bold]Keychain hygiene[/bold]", align="left", style="dim")
+    return lines, ok, fail
+
+
+def _check_hardcoded_paths() -> SectionResult:
+    violations = check_hardcoded_paths(REPO_ROOT / ".zshrc")
+    if not violations:
+        return ["[green]OK[/green]      No hardcoded paths found"], 1, 0
+    lines = [f"[red]FAIL[/red]    .zshrc:{lineno}: {line}" for lineno, line in violations]
+    return lines, 0, len(lines)
+
+
+def _check_keychain() -> SectionResult:
     r = subprocess.run(
         ["security", "find-generic-password", "-s", "bw-master", "-a", "bitwarden"],
         capture_output=True, text=True,
     )
     if r.returncode == 0:
-        console.print("[green]OK[/green]      Bitwarden master password in Keychain")
-        ok += 1
-    else:
-        console.print("[red]FAIL[/red]    Bitwarden master password not in Keychain")
-        fail += 1
-    console.print()
+        return ["[green]OK[/green]      Bitwarden master password in Keychain"], 1, 0
+    return ["[red]FAIL[/red]    Bitwarden master password not in Keychain"], 0, 1
 
-    # 9. Pre-commit hooks
-    console.rule("[bold]Pre-commit hooks[/bold]", align="left", style="dim")
-    hook_file = repo_root() / ".git" / "hooks" / "pre-commit"
-    if hook_file.is_file() and "pre-commit" in hook_file.read_text():
-        console.print("[green]OK[/green]      git hooks installed")
-        ok += 1
-    else:
-        console.print("[red]FAIL[/red]    git hooks not installed (run: pre-commit install)")
-        fail += 1
-    console.print()
 
-    # 10. Pyright type-checking
-    console.rule("[bold]Pyright type-checking[/bold]", align="left", style="dim")
+def _check_precommit_hooks() -> SectionResult:
+    hook_file = REPO_ROOT / ".git" / "hooks" / "pre-commit"
+    # The framework's marker sits in the hook's header comment.
+    if file_contains(hook_file, b"pre-commit", limit=4096):
+        return ["[green]OK[/green]      git hooks installed"], 1, 0
+    return ["[red]FAIL[/red]    git hooks not installed (run: pre-commit install)"], 0, 1
+
+
+def _check_pyright() -> SectionResult:
     pyright_result = subprocess.run(
         ["uv", "run", "--frozen", "pyright"],
-        capture_output=True, text=True, cwd=repo_root(),
+        capture_output=True, text=True, cwd=REPO_ROOT,
     )
     if pyright_result.returncode == 0:
-        console.print("[green]OK[/green]      pyright")
-        ok += 1
-    else:
-        console.print("[red]FAIL[/red]    pyright")
-        output = (pyright_result.stdout + pyright_result.stderr).strip()
-        if output:
-            console.print(output)
-        fail += 1
-    console.print()
+        return ["[green]OK[/green]      pyright"], 1, 0
+    lines = ["[red]FAIL[/red]    pyright"]
+    output = (pyright_result.stdout + pyright_result.stderr).strip()
+    if output:
+        lines.append(output)
+    return lines, 0, 1
 
-    # 11. macOS defaults
-    if platform.system() == "Darwin":
-        console.rule("[bold]macOS defaults[/bold]", align="left", style="dim")
-        entries = load_defaults_entries()
-        for entry in entries:
-            st, raw = read_default(entry.domain, entry.key)
-            if st != ReadStatus.ok or raw is None:
-                console.print(
-                    f"[red]DRIFT[/red]   {entry.key} - {st.value}"
-                    f" (expected {entry.value!r})"
-                )
-                fail += 1
-                continue
-            current = parse_default_value(raw, entry.type)
-            if values_equal(current, entry.value, entry.type):
-                console.print(f"[green]OK[/green]      {entry.key} = {current!r}")
-                ok += 1
-            else:
-                console.print(
-                    f"[red]DRIFT[/red]   {entry.key}:"
-                    f" saved={entry.value!r} current={current!r}"
-                )
-                fail += 1
-        console.print()
 
-    # 12. Remote access
-    if platform.system() == "Darwin":
-        console.rule("[bold]Remote access[/bold]", align="left", style="dim")
-        remote_checks: list[tuple[str, int, str]] = [
-            ("Remote Login (SSH)", 22, "sudo systemsetup -f -setremotelogin on"),
-            ("Screen Sharing", 5900, "sudo launchctl bootstrap system /System/Library/LaunchDaemons/com.apple.screensharing.plist"),
-        ]
-        for label, port, hint in remote_checks:
-            try:
-                with socket.create_connection(("localhost", port), timeout=1.0):
-                    console.print(f"[green]OK[/green]      {label} (port {port})")
-                    ok += 1
-            except (OSError, TimeoutError):
-                console.print(
-                    f"[red]FAIL[/red]    {label} not enabled"
-                    f" (enable: {hint})"
-                )
-                fail += 1
+def _check_macos_defaults() -> SectionResult:
+    lines: list[str] = []
+    ok = fail = 0
+    entries = load_defaults_entries()
+    prefetch_domains(entry.domain for entry in entries)
+    for entry in entries:
+        st, raw = read_default(entry.domain, entry.key)
+        if st != ReadStatus.ok or raw is None:
+            lines.append(
+                f"[red]DRIFT[/red]   {entry.key} - {st.value}"
+                f" (expected {entry.value!r})"
+            )
+            fail += 1
+            continue
+        current = parse_default_value(raw, entry.type)
+        if values_equal(current, entry.value, entry.type):
+            lines.append(f"[green]OK[/green]      {entry.key} = {current!r}")
+            ok += 1
+        else:
+            lines.append(
+                f"[red]DRIFT[/red]   {entry.key}:"
+                f" saved={entry.value!r} current={current!r}"
+            )
+            fail += 1
+    return lines, ok, fail
 
-        # Tailscale
+
+def _check_remote_access() -> SectionResult:
+    import socket
+
+    lines: list[str] = []
+    ok = fail = 0
+    remote_checks: list[tuple[str, int, str]] = [
+        ("Remote Login (SSH)", 22, "sudo systemsetup -f -setremotelogin on"),
+        ("Screen Sharing", 5900, "sudo launchctl bootstrap system /System/Library/LaunchDaemons/com.apple.screensharing.plist"),
+    ]
+    for label, port, hint in remote_checks:
         try:
-            ts = subprocess.run(
-                ["/Applications/Tailscale.app/Contents/MacOS/Tailscale", "status"],
-                capture_output=True, text=True,
-            )
-            if ts.returncode == 0:
-                console.print("[green]OK[/green]      Tailscale connected")
+            with socket.create_connection(("localhost", port), timeout=1.0):
+                lines.append(f"[green]OK[/green]      {label} (port {port})")
                 ok += 1
-            else:
-                console.print("[red]FAIL[/red]    Tailscale not running (open Tailscale app)")
-                fail += 1
-        except FileNotFoundError:
-            console.print("[red]FAIL[/red]    Tailscale not installed")
+        except (OSError, TimeoutError):
+            lines.append(
+                f"[red]FAIL[/red]    {label} not enabled"
+                f" (enable: {hint})"
+            )
             fail += 1
-        console.print()
 
-    # 13. Launchd jobs
-    if platform.system() == "Darwin":
-        console.rule("[bold]Launchd jobs[/bold]", align="left", style="dim")
-        for entry in load_job_entries():
-            if not is_script_present(entry):
-                console.print(f"[red]FAIL[/red]    {entry.label} - script missing: {entry.script}")
-                fail += 1
-                continue
-            if not is_script_executable(entry):
-                console.print(f"[red]FAIL[/red]    {entry.label} - script not executable: {entry.script}")
-                fail += 1
-                continue
-            if not is_plist_current(entry):
-                console.print(
-                    f"[red]FAIL[/red]    {entry.label} - plist missing or outdated"
-                    " (run: ./scripts/bootstrap.py jobs apply -y)"
-                )
-                fail += 1
-                continue
-            if not is_job_loaded(entry.label):
-                console.print(
-                    f"[red]FAIL[/red]    {entry.label} - not loaded"
-                    " (run: ./scripts/bootstrap.py jobs apply -y)"
-                )
-                fail += 1
-                continue
-            console.print(f"[green]OK[/green]      {entry.label}")
+    # Tailscale
+    try:
+        ts = subprocess.run(
+            ["/Applications/Tailscale.app/Contents/MacOS/Tailscale", "status"],
+            capture_output=True, text=True,
+        )
+        if ts.returncode == 0:
+            lines.append("[green]OK[/green]      Tailscale connected")
             ok += 1
-        console.print()
+        else:
+            lines.append("[red]FAIL[/red]    Tailscale not running (open Tailscale app)")
+            fail += 1
+    except FileNotFoundError:
+        lines.append("[red]FAIL[/red]    Tailscale not installed")
+        fail += 1
+    return lines, ok, fail
+
+
+def _check_launchd_jobs() -> SectionResult:
+    lines: list[str] = []
+    ok = fail = 0
+    for entry in load_job_entries():
+        if not is_script_present(entry):
+            lines.append(f"[red]FAIL[/red]    {entry.label} - script missing: {entry.script}")
+            fail += 1
+            continue
+        if not is_script_executable(entry):
+            lines.append(f"[red]FAIL[/red]    {entry.label} - script not executable: {entry.script}")
+            fail += 1
+            continue
+        if not is_plist_current(entry):
+            lines.append(
+                f"[red]FAIL[/red]    {entry.label} - plist missing or outdated"
+                " (run: ./scripts/bootstrap.py jobs apply -y)"
+            )
+            fail += 1
+            continue
+        if not is_job_loaded(entry.label):
+            lines.append(
+                f"[red]FAIL[/red]    {entry.label} - not loaded"
+                " (run: ./scripts/bootstrap.py jobs apply -y)"
+            )
+            fail += 1
+            continue
+        lines.append(f"[green]OK[/green]      {entry.label}")
+        ok += 1
+    return lines, ok, fail
+
+
+@app.command()
+def verify() -> None:
+    """Run all verification checks on your environment."""
+    console = get_console()
+    ok = fail = 0
+
+    sections: list[tuple[str, Callable[[], SectionResult]]] = [
+        ("Symlink health", _check_symlinks),
+        ("Dependencies", _check_dependencies),
+        ("JSON schema validation", _check_schemas),
+        ("JSON formatting", _check_formatting),
+        ("Hardcoded home paths", _check_hardcoded_paths),
+        ("GPG signing", verify_gpg_signing),
+        ("SSH keys", verify_ssh_keys),
+        ("Keychain hygiene", _check_keychain),
+        ("Pre-commit hooks", _check_precommit_hooks),
+        ("Pyright type-checking", _check_pyright),
+    ]
+    if platform.system() == "Darwin":
+        sections += [
+            ("macOS defaults", _check_macos_defaults),
+            ("Remote access", _check_remote_access),
+            ("Launchd jobs", _check_launchd_jobs),
+        ]
+
+    # Sections are independent and mostly wait on I/O or subprocesses, so
+    # run them concurrently and print the results in the original order.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [(title, pool.submit(check)) for title, check in sections]
+        for title, future in futures:
+            console.rule(f"[bold]{title}[/bold]", align="left", style="dim")
+            lines, section_ok, section_fail = future.result()
+            lines.append("")
+            console.print("\n".join(lines))
+            ok += section_ok
+            fail += section_fail
 
     # Summary
     summary = f"[green]{ok} ok[/green]"
@@ -391,12 +411,14 @@ def link(
 @defaults_app.command("export")
 def defaults_export() -> None:
     """Read current system values and update macos-defaults.json."""
+    console = get_console()
     require_darwin()
 
-    defaults_file = repo_root() / "scripts" / "macos-defaults.json"
-    with open(defaults_file, encoding="utf-8") as f:
-        data = json.load(f)
+    defaults_file = DEFAULTS_JSON
+    # Parsed fresh (not via load_json) since this copy is mutated and saved.
+    data = json_loads(defaults_file.read_bytes())
 
+    prefetch_domains(item["domain"] for item in data["defaults"])
     updated = 0
     for item in data["defaults"]:
         st, raw = read_default(item["domain"], item["key"])
@@ -426,11 +448,13 @@ def defaults_apply(
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmations."),
 ) -> None:
     """Apply saved defaults values to the system."""
+    console = get_console()
     require_darwin()
 
     entries = load_defaults_entries()
     changes: list[DefaultEntry] = []
 
+    prefetch_domains(entry.domain for entry in entries)
     for entry in entries:
         st, raw = read_default(entry.domain, entry.key)
         if st == ReadStatus.ok and raw is not None:
@@ -457,8 +481,7 @@ def defaults_apply(
 
     restart_apps: set[str] = set()
     for entry in changes:
-        args = ["write", entry.domain, entry.key, *format_write_value(entry.value, entry.type)]
-        r = run_defaults_cmd(*args)
+        r = write_default(entry.domain, entry.key, entry.type, entry.value)
         if r.returncode != 0:
             console.print(f"[red]FAIL[/red]    {entry.domain} {entry.key}: {r.stderr.strip()}")
         else:
@@ -474,12 +497,11 @@ def defaults_apply(
 @defaults_app.command("diff")
 def defaults_diff() -> None:
     """Show differences between saved and current system values."""
+    console = get_console()
     require_darwin()
 
-    entries = load_defaults_entries()
-    by_category: dict[str, list[DefaultEntry]] = defaultdict(list)
-    for entry in entries:
-        by_category[entry.category].append(entry)
+    by_category = load_defaults_by_category()
+    prefetch_domains(entry.domain for entry in load_defaults_entries())
 
     has_diff = False
     for category in sorted(by_category):
@@ -509,6 +531,7 @@ def jobs_apply(
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmations."),
 ) -> None:
     """Generate plist files and load launchd jobs."""
+    console = get_console()
     require_darwin()
 
     entries = load_job_entries()
@@ -568,6 +591,7 @@ def jobs_remove(
     yes: bool = typer.Option(False, "-y", "--yes", help="Skip confirmations."),
 ) -> None:
     """Unload launchd jobs and delete plist files."""
+    console = get_console()
     require_darwin()
 
     entries = load_job_entries()
@@ -607,6 +631,7 @@ def jobs_remove(
 @jobs_app.command("status")
 def jobs_status() -> None:
     """Show status of all launchd jobs."""
+    console = get_console()
     require_darwin()
 
     entries = load_job_entries()
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import json
+import functools
 import math
+import operator
+import plistlib
 import subprocess
+import xml.parsers.expat
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
-
-from .utils import repo_root
+from .utils import DEFAULTS_JSON, load_json
 
 
 class ReadStatus(str, Enum):
@@ -16,7 +19,7 @@ class ReadStatus(str, Enum):
     domain_missing = "domain_missing"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DefaultEntry:
     domain: str
     key: str
@@ -27,11 +30,18 @@ class DefaultEntry:
     restart: str | None = None
 
 
-def load_defaults_entries() -> list[DefaultEntry]:
-    defaults_file = repo_root() / "scripts" / "macos-defaults.json"
-    with open(defaults_file, encoding="utf-8") as f:
-        data = json.load(f)
-    return [
+def load_defaults_entries() -> tuple[DefaultEntry, ...]:
+    return _load_defaults_entries(DEFAULTS_JSON.stat().st_mtime_ns)
+
+
+def load_defaults_by_category() -> dict[str, tuple[DefaultEntry, ...]]:
+    return _load_defaults_by_category(DEFAULTS_JSON.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_defaults_entries(mtime_ns: int) -> tuple[DefaultEntry, ...]:
+    data = load_json(DEFAULTS_JSON)
+    return tuple(
         DefaultEntry(
             domain=item["domain"],
             key=item["key"],
@@ -42,7 +52,15 @@ def load_defaults_entries() -> list[DefaultEntry]:
             restart=item.get("restart"),
         )
         for item in data["defaults"]
-    ]
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_defaults_by_category(mtime_ns: int) -> dict[str, tuple[DefaultEntry, ...]]:
+    by_category: dict[str, list[DefaultEntry]] = {}
+    for entry in _load_defaults_entries(mtime_ns):
+        by_category.setdefault(entry.category, []).append(entry)
+    return {category: tuple(entries) for category, entries in by_category.items()}
 
 
 def run_defaults_cmd(*args: str) -> subprocess.CompletedProcess[str]:
@@ -52,44 +70,97 @@ def run_defaults_cmd(*args: str) -> subprocess.CompletedProcess[str]:
     )
 
 
-def read_default(domain: str, key: str) -> tuple[ReadStatus, str | None]:
-    r = run_defaults_cmd("read", domain, key)
+@functools.lru_cache(maxsize=None)
+def _read_domain_plist(domain: str) -> dict | None:
+    r = subprocess.run(
+        ["defaults", "export", domain, "-"],
+        capture_output=True,
+    )
     if r.returncode != 0:
-        stderr = r.stderr.strip()
-        if "does not exist" in stderr:
-            if "domain" in stderr.split("does not exist")[0].lower():
-                return ReadStatus.domain_missing, None
-            return ReadStatus.key_missing, None
+        return None
+    try:
+        plist = plistlib.loads(r.stdout)
+    except (ValueError, xml.parsers.expat.ExpatError):
+        return None
+    if not isinstance(plist, dict) or not plist:
+        return None
+    return plist
+
+
+def prefetch_domains(domains: Iterable[str]) -> None:
+    # Each export is its own `defaults` process; run them side by side so
+    # the read_default calls that follow are served from the cache.
+    unique = list(dict.fromkeys(domains))
+    if len(unique) < 2:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(unique))) as pool:
+        list(pool.map(_read_domain_plist, unique))
+
+
+def _format_read_value(value: object) -> str:
+    # Mirror `defaults read` output so parse_default_value stays unchanged.
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, float) and value.is_integer():
+        return repr(int(value))
+    return str(value)
+
+
+def read_default(domain: str, key: str) -> tuple[ReadStatus, str | None]:
+    plist = _read_domain_plist(domain)
+    if plist is None:
+        return ReadStatus.domain_missing, None
+    if key not in plist:
         return ReadStatus.key_missing, None
-    return ReadStatus.ok, r.stdout.strip()
+    return ReadStatus.ok, _format_read_value(plist[key])
+
+
+def write_default(
+    domain: str, key: str, type_: str, value: object,
+) -> subprocess.CompletedProcess[str]:
+    r = run_defaults_cmd("write", domain, key, *format_write_value(value, type_))
+    _read_domain_plist.cache_clear()
+    return r
+
+
+_TRUE_STRINGS = frozenset({"1", "true", "YES"})
+
+
+def _float_close(a: object, b: object) -> bool:
+    try:
+        return math.isclose(float(str(a)), float(str(b)), rel_tol=1e-9)
+    except (TypeError, ValueError):
+        return False
+
+
+_PARSE: dict[str, Callable[[str], object]] = {
+    "bool": lambda raw: raw.strip() in _TRUE_STRINGS,
+    "int": lambda raw: int(raw.strip()),
+    "float": lambda raw: float(raw.strip()),
+}
+
+_FORMAT_WRITE: dict[str, Callable[[object], list[str]]] = {
+    "bool": lambda value: ["-bool", "TRUE" if value else "FALSE"],
+    "int": lambda value: ["-int", str(value)],
+    "float": lambda value: ["-float", str(value)],
+}
+
+_EQ: dict[str, Callable[[object, object], bool]] = {
+    "bool": lambda a, b: bool(a) == bool(b),
+    "float": _float_close,
+}
 
 
 def parse_default_value(raw: str, type_: str) -> object:
-    if type_ == "bool":
-        return raw.strip() in {"1", "true", "YES"}
-    if type_ == "int":
-        return int(raw.strip())
-    if type_ == "float":
-        return float(raw.strip())
-    return raw.strip()
+    return _PARSE.get(type_, str.strip)(raw)
 
 
 def format_write_value(value: object, type_: str) -> list[str]:
-    if type_ == "bool":
-        return ["-bool", "TRUE" if value else "FALSE"]
-    if type_ == "int":
-        return ["-int", str(value)]
-    if type_ == "float":
-        return ["-float", str(value)]
-    return ["-string", str(value)]
+    fmt = _FORMAT_WRITE.get(type_)
+    if fmt is None:
+        return ["-string", str(value)]
+    return fmt(value)
 
 
 def values_equal(a: object, b: object, type_: str) -> bool:
-    if type_ == "bool":
-        return bool(a) == bool(b)
-    if type_ == "float":
-        try:
-            return math.isclose(float(str(a)), float(str(b)), rel_tol=1e-9)
-        except (TypeError, ValueError):
-            return False
-    return a == b
+    return _EQ.get(type_, operator.eq)(a, b)
@@ -1,25 +1,148 @@
 from __future__ import annotations
 
-import json
+import functools
 import os
 import shutil
+import threading
 from collections.abc import Callable
-from pathlib import Path
+from dataclasses import dataclass
+
+from .utils import DEPS_JSON, HOME, load_json
+
+# Serializes the one-time directory scans below; the probes run on a pool.
+_scan_lock = threading.Lock()
+
+
+@functools.cache
+def _scan_path() -> tuple[tuple[str, frozenset[str]], ...]:
+    # One scandir per PATH entry instead of a stat per entry per command.
+    dirs: list[tuple[str, frozenset[str]]] = []
+    for d in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if not d:
+            continue
+        try:
+            with os.scandir(d) as it:
+                dirs.append((d, frozenset(entry.name for entry in it)))
+        except OSError:
+            continue
+    return tuple(dirs)
+
+
+@functools.cache
+def _which(name: str) -> str | None:
+    if os.path.dirname(name):
+        return shutil.which(name)
+    with _scan_lock:
+        dirs = _scan_path()
+    for d, names in dirs:
+        if name in names:
+            path = os.path.join(d, name)
+            if os.access(path, os.X_OK) and not os.path.isdir(path):
+                return path
+    return None
+
+
+@functools.cache
+def _list_dir(parent: str) -> dict[str, os.DirEntry[str]] | None:
+    # Sibling dir/file targets (e.g. the apps under /Applications) share one
+    # scandir. None means unreadable: fall back to a plain stat.
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except OSError:
+        return None
+
+
+def _probe_entry(
+    path: str,
+    fallback: Callable[[str], bool],
+    is_kind: Callable[[os.DirEntry[str]], bool],
+) -> bool:
+    parent, name = os.path.split(path)
+    if not name:
+        return fallback(path)
+    with _scan_lock:
+        entries = _list_dir(parent)
+    if entries is None:
+        return fallback(path)
+    entry = entries.get(name)
+    if entry is None:
+        # Names that differ only in case or normalization, and "." or "..",
+        # never match a listing key; let the filesystem decide.
+        return fallback(path)
+    try:
+        return is_kind(entry)
+    except OSError:
+        return False
+
+
+@functools.cache
+def _isdir(path: str) -> bool:
+    return _probe_entry(path, os.path.isdir, os.DirEntry.is_dir)
+
+
+@functools.cache
+def _isfile(path: str) -> bool:
+    return _probe_entry(path, os.path.isfile, os.DirEntry.is_file)
 
-from .utils import repo_root
 
 KIND_PREDICATE: dict[str, Callable[[str], object]] = {
-    "command": shutil.which,
-    "dir": os.path.isdir,
-    "file": os.path.isfile,
+    "command": _which,
+    "dir": _isdir,
+    "file": _isfile,
 }
 
 
-def load_dep_checks() -> list[dict]:
-    checks_file = repo_root() / "scripts" / "deps.json"
-    with open(checks_file, encoding="utf-8") as f:
-        data = json.load(f)
-    home = str(Path.home())
-    for check in data["checks"]:
-        check["target"] = check["target"].replace("$HOME", home)
-    return data["checks"]
+def clear_predicate_caches() -> None:
+    _scan_path.cache_clear()
+    _list_dir.cache_clear()
+    _which.cache_clear()
+    _isdir.cache_clear()
+    _isfile.cache_clear()
+
+
+@dataclass(frozen=True, slots=True)
+class DepCheck:
+    label: str
+    kind: str
+    target: str
+    install: str = ""
+    depends: tuple[str, ...] = ()
+    notes: tuple[str, ...] = ()
+
+
+def load_dep_checks() -> tuple[DepCheck, ...]:
+    return _load_deps(DEPS_JSON.stat().st_mtime_ns)[0]
+
+
+def load_dep_required_by() -> dict[str, list[str]]:
+    return _load_deps(DEPS_JSON.stat().st_mtime_ns)[1]
+
+
+@functools.lru_cache(maxsize=4)
+def _load_deps(mtime_ns: int) -> tuple[tuple[DepCheck, ...], dict[str, list[str]]]:
+    data = load_json(DEPS_JSON)
+    home = str(HOME)
+    checks = sorted(
+        (
+            DepCheck(
+                label=check["label"],
+                kind=check["kind"],
+                target=check["target"].replace("$HOME", home),
+                install=check.get("install", ""),
+                depends=tuple(check.get("depends", ())),
+                notes=tuple(check.get("notes", ())),
+            )
+            for check in data["checks"]
+        ),
+        key=lambda c: c.label.casefold(),
+    )
+
+    # Reverse dependency map: label -> sorted labels that depend on it
+    required_by: dict[str, list[str]] = {}
+    for check in checks:
+        for dep in check.depends:
+            required_by.setdefault(dep, []).append(check.label)
+    return tuple(checks), {dep: sorted(labels) for dep, labels in required_by.items()}
@@ -1,67 +1,86 @@
 from __future__ import annotations
 
+import re
 import shutil
 import subprocess
-from pathlib import Path
 
-from .utils import console
+from .utils import HOME, SectionResult, file_contains
 
 
-def git_config_get(key: str) -> str | None:
+def git_config_get_many(*keys: str) -> dict[str, str]:
+    pattern = "^(" + "|".join(re.escape(key) for key in keys) + ")$"
     r = subprocess.run(
-        ["git", "config", "--global", key],
+        ["git", "config", "--global", "--get-regexp", pattern],
         capture_output=True, text=True,
     )
-    return r.stdout.strip() or None if r.returncode == 0 else None
+    values: dict[str, str] = {}
+    if r.returncode != 0:
+        return values
+    for line in r.stdout.splitlines():
+        name, _, value = line.partition(" ")
+        values[name] = value.strip()
+    return values
 
 
-def verify_gpg_signing() -> tuple[int, int]:
+def _pinentry_status() -> tuple[str, bool]:
+    agent_conf = HOME / ".gnupg" / "gpg-agent.conf"
+    if file_contains(agent_conf, b"pinentry-mac"):
+        pinentry = shutil.which("pinentry-mac")
+        if pinentry:
+            return f"[green]OK[/green]      pinentry-mac ({pinentry})", True
+        return "[red]FAIL[/red]    pinentry-mac configured but binary not found", False
+    return "[red]FAIL[/red]    pinentry-mac not configured in gpg-agent.conf", False
+
+
+def verify_gpg_signing() -> SectionResult:
+    lines: list[str] = []
     ok = fail = 0
 
-    gpg_sign = git_config_get("commit.gpgsign")
+    config = git_config_get_many("commit.gpgsign", "user.signingkey")
+    gpg_sign = config.get("commit.gpgsign") or None
     if gpg_sign == "true":
-        console.print("[green]OK[/green]      commit.gpgsign = true")
+        lines.append("[green]OK[/green]      commit.gpgsign = true")
         ok += 1
     else:
-        console.print(f"[red]FAIL[/red]    commit.gpgsign = {gpg_sign or '(unset)'}")
+        lines.append(f"[red]FAIL[/red]    commit.gpgsign = {gpg_sign or '(unset)'}")
         fail += 1
 
-    signing_key = git_config_get("user.signingkey")
+    signing_key = config.get("user.signingkey") or None
+    gpg = None
     if signing_key:
-        r = subprocess.run(
+        # Start gpg now and check pinentry while it runs.
+        gpg = subprocess.Popen(
             ["gpg", "--list-secret-keys", "--keyid-format", "long", signing_key],
-            capture_output=True, text=True,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
         )
-        if r.returncode == 0 and signing_key in r.stdout:
-            console.print(f"[green]OK[/green]      signing key {signing_key[:16]}...")
+    pinentry_line, pinentry_ok = _pinentry_status()
+
+    if signing_key and gpg is not None:
+        stdout, _ = gpg.communicate()
+        if gpg.returncode == 0 and signing_key in stdout:
+            lines.append(f"[green]OK[/green]      signing key {signing_key[:16]}...")
             ok += 1
         else:
-            console.print(f"[red]FAIL[/red]    signing key {signing_key} not found in GPG keyring")
+            lines.append(f"[red]FAIL[/red]    signing key {signing_key} not found in GPG keyring")
             fail += 1
     else:
-        console.print("[red]FAIL[/red]    user.signingkey not set")
+        lines.append("[red]FAIL[/red]    user.signingkey not set")
         fail += 1
 
-    agent_conf = Path.home() / ".gnupg" / "gpg-agent.conf"
-    if agent_conf.is_file() and "pinentry-mac" in agent_conf.read_text():
-        pinentry = shutil.which("pinentry-mac")
-        if pinentry:
-            console.print(f"[green]OK[/green]      pinentry-mac ({pinentry})")
-            ok += 1
-        else:
-            console.print("[red]FAIL[/red]    pinentry-mac configured but binary not found")
-            fail += 1
+    lines.append(pinentry_line)
+    if pinentry_ok:
+        ok += 1
     else:
-        console.print("[red]FAIL[/red]    pinentry-mac not configured in gpg-agent.conf")
         fail += 1
 
-    return ok, fail
+    return lines, ok, fail
 
 
-def verify_ssh_keys() -> tuple[int, int]:
+def verify_ssh_keys() -> SectionResult:
+    lines: list[str] = []
     ok = fail = 0
 
-    ssh_dir = Path.home() / ".ssh"
+    ssh_dir = HOME / ".ssh"
     key_types = ("ed25519", "rsa", "ecdsa")
     found: list[str] = []
     for kt in key_types:
@@ -72,13 +91,13 @@ def verify_ssh_keys() -> tuple[int, int]:
 
     if found:
         for kt in found:
-            console.print(f"[green]OK[/green]      SSH key pair: id_{kt}")
+            lines.append(f"[green]OK[/green]      SSH key pair: id_{kt}")
             ok += 1
     else:
-        console.print(
+        lines.append(
             "[red]FAIL[/red]    No SSH key pair found"
             " (run: ssh-keygen -t ed25519)"
         )
         fail += 1
 
-    return ok, fail
+    return lines, ok, fail
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
 import os
 import plistlib
 import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from .utils import repo_root
+from .utils import HOME, JOBS_JSON, REPO_ROOT, load_json
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class JobEntry:
     label: str
     description: str
@@ -21,9 +20,7 @@ class JobEntry:
 
 
 def load_job_entries() -> list[JobEntry]:
-    jobs_file = repo_root() / "scripts" / "jobs.json"
-    with open(jobs_file, encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_json(JOBS_JSON)
     return [
         JobEntry(
             label=item["label"],
@@ -38,13 +35,12 @@ def load_job_entries() -> list[JobEntry]:
 
 
 def generate_plist(entry: JobEntry) -> dict:
-    root = repo_root()
-    script_path = str(root / entry.script)
+    script_path = str(REPO_ROOT / entry.script)
 
     plist: dict = {
         "Label": entry.label,
         "ProgramArguments": ["/bin/bash", script_path],
-        "WorkingDirectory": str(root),
+        "WorkingDirectory": str(REPO_ROOT),
     }
 
     if "interval" in entry.schedule:
@@ -68,7 +64,7 @@ def generate_plist(entry: JobEntry) -> dict:
         plist["EnvironmentVariables"] = dict(entry.environment)
 
     log_path = entry.log or str(
-        Path.home() / "Library" / "Logs" / f"{entry.label}.log"
+        HOME / "Library" / "Logs" / f"{entry.label}.log"
     )
     plist["StandardOutPath"] = log_path
     plist["StandardErrorPath"] = log_path
@@ -77,7 +73,7 @@ def generate_plist(entry: JobEntry) -> dict:
 
 
 def _plist_path(label: str) -> Path:
-    return Path.home() / "Library" / "LaunchAgents" / f"{label}.plist"
+    return HOME / "Library" / "LaunchAgents" / f"{label}.plist"
 
 
 def write_plist(entry: JobEntry) -> Path:
@@ -112,11 +108,11 @@ def is_job_loaded(label: str) -> bool:
 
 
 def is_script_present(entry: JobEntry) -> bool:
-    return (repo_root() / entry.script).is_file()
+    return (REPO_ROOT / entry.script).is_file()
 
 
 def is_script_executable(entry: JobEntry) -> bool:
-    path = repo_root() / entry.script
+    path = REPO_ROOT / entry.script
     return path.is_file() and os.access(path, os.X_OK)
 
 
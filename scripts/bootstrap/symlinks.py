@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-import json
+import functools
+import os
+import stat
+import time
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
 import typer
 
-from .utils import display_path, repo_root
+from .utils import HOME, LINKS_JSON, REPO_ROOT, display_path, load_json
+
+
+_STATUS_FMT = "{label:<7} {key:<22} {summary}{detail}".format
 
 
 class ReplaceMode(str, Enum):
@@ -18,7 +24,7 @@ class ReplaceMode(str, Enum):
     force = "force"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LinkItem:
     key: str
     title: str
@@ -35,42 +41,49 @@ def target_path_for(item: dict[str, str], home: Path) -> Path:
     return home / item.get("target", item["key"])
 
 
-def load_link_items() -> list[LinkItem]:
-    links_file = repo_root() / "scripts" / "links.json"
-    with open(links_file, encoding="utf-8") as f:
-        data = json.load(f)
-    root = repo_root()
-    home = Path.home()
-    return [
+def load_link_items() -> tuple[LinkItem, ...]:
+    return _load_link_items(LINKS_JSON.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_link_items(mtime_ns: int) -> tuple[LinkItem, ...]:
+    data = load_json(LINKS_JSON)
+    return tuple(
         LinkItem(
             key=item["key"],
             title=item.get("target", item["key"]),
             description=item["description"],
-            source=source_path_for(item, root),
-            target=target_path_for(item, home),
+            source=source_path_for(item, REPO_ROOT),
+            target=target_path_for(item, HOME),
         )
         for item in data["links"]
-    ]
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _link_lookup(mtime_ns: int) -> dict[str, LinkItem]:
+    # Shared across callers: treat the result as read-only.
+    return {item.key: item for item in _load_link_items(mtime_ns)}
 
 
 def resolve_items(keys: Iterable[str], use_all: bool) -> list[LinkItem]:
-    items = load_link_items()
+    mtime_ns = LINKS_JSON.stat().st_mtime_ns
     if use_all:
-        return items
+        return list(_load_link_items(mtime_ns))
 
-    lookup = {item.key: item for item in items}
+    lookup = _link_lookup(mtime_ns)
     chosen: list[LinkItem] = []
+    seen: set[str] = set()
     unknown: list[str] = []
 
     for raw in keys:
         key = raw.strip()
-        if key in lookup:
-            item = lookup[key]
-        else:
+        if key not in lookup:
             unknown.append(raw)
             continue
-        if item not in chosen:
-            chosen.append(item)
+        if key not in seen:
+            seen.add(key)
+            chosen.append(lookup[key])
 
     if unknown:
         raise typer.BadParameter(
@@ -80,20 +93,84 @@ def resolve_items(keys: Iterable[str], use_all: bool) -> list[LinkItem]:
     return chosen
 
 
+def _lstat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return os.lstat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _kind_from_stat(st: os.stat_result | None) -> str:
+    if st is None:
+        return "absent"
+    if stat.S_ISLNK(st.st_mode):
+        return "symlink"
+    if stat.S_ISDIR(st.st_mode):
+        return "dir"
+    return "file"
+
+
+def _kind_from_entry(entry: os.DirEntry[str]) -> str:
+    if entry.is_symlink():
+        return "symlink"
+    if entry.is_dir(follow_symlinks=False):
+        return "dir"
+    return "file"
+
+
+def target_kinds(items: Iterable[LinkItem]) -> dict[Path, str]:
+    by_parent: dict[Path, list[Path]] = {}
+    for item in items:
+        by_parent.setdefault(item.target.parent, []).append(item.target)
+
+    kinds: dict[Path, str] = {}
+    for parent, targets in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = {}
+        except OSError:
+            for target in targets:
+                kinds[target] = _kind_from_stat(_lstat_or_none(target))
+            continue
+        for target in targets:
+            entry = entries.get(target.name)
+            if entry is not None:
+                kinds[target] = _kind_from_entry(entry)
+            else:
+                # A miss may still exist under another case or normalization
+                # on case-insensitive filesystems (APFS), so confirm it.
+                kinds[target] = _kind_from_stat(_lstat_or_none(target))
+    return kinds
+
+
 def is_source_present(item: LinkItem) -> bool:
-    return item.source.exists() or item.source.is_symlink()
+    return _lstat_or_none(item.source) is not None
 
 
 def link_target_summary(item: LinkItem) -> str:
     return f"{display_path(item.source)} -> {display_path(item.target)}"
 
 
-def status_of(item: LinkItem) -> tuple[str, str]:
+def status_of(item: LinkItem, target_kind: str | None = None) -> tuple[str, str]:
     if not is_source_present(item):
         return "missing-source", "source missing"
 
     target = item.target
-    if target.is_symlink():
+    if target_kind is None:
+        target_kind = _kind_from_stat(_lstat_or_none(target))
+    if target_kind == "absent":
+        return "absent", "target missing"
+
+    if target_kind == "symlink":
+        raw = os.readlink(target)
+        # normpath folds ".." textually, which is wrong when the target's
+        # parent is itself a symlink; leave those links to resolve().
+        if os.path.isabs(raw) or ".." not in Path(raw).parts:
+            link_target = Path(os.path.normpath(target.parent / raw))
+            if link_target == item.source:
+                return "linked", f"points to {display_path(link_target)}"
         target_resolved = target.resolve(strict=False)
         source_resolved = item.source.resolve(strict=False)
         if target_resolved == source_resolved:
@@ -102,12 +179,23 @@ def status_of(item: LinkItem) -> tuple[str, str]:
             return "broken-link", f"points to {display_path(target_resolved)}"
         return "linked-elsewhere", f"points to {display_path(target_resolved)}"
 
-    if target.exists():
-        if target.is_dir():
-            return "target-dir", "target is a directory"
-        return "exists", "target exists"
+    if target_kind == "dir":
+        return "target-dir", "target is a directory"
+    return "exists", "target exists"
+
 
-    return "absent", "target missing"
+def compute_statuses(items: Iterable[LinkItem]) -> dict[str, tuple[str, str]]:
+    items = list(items)
+    kinds = target_kinds(items)
+
+    def status(item: LinkItem) -> tuple[str, str]:
+        return status_of(item, kinds[item.target])
+
+    # The per-item lstat/readlink calls are independent; overlap them to
+    # hide filesystem latency (e.g. network homes).
+    with ThreadPoolExecutor(max_workers=min(8, len(items) or 1)) as pool:
+        results = list(pool.map(status, items))
+    return {item.key: result for item, result in zip(items, results)}
 
 
 def status_label(status: str) -> str:
@@ -124,15 +212,28 @@ def status_label(status: str) -> str:
 
 
 def print_status(items: Iterable[LinkItem]) -> None:
+    items = list(items)
+    statuses = compute_statuses(items)
+    lines: list[str] = []
     for item in items:
-        status, detail = status_of(item)
-        label = status_label(status)
-        detail_text = f" ({detail})" if detail else ""
-        typer.echo(f"{label:<7} {item.key:<22} {link_target_summary(item)}{detail_text}")
-
-
-def ensure_parent_dir(path: Path, dry_run: bool) -> None:
+        status, detail = statuses[item.key]
+        lines.append(_STATUS_FMT(
+            label=status_label(status),
+            key=item.key,
+            summary=link_target_summary(item),
+            detail=f" ({detail})" if detail else "",
+        ))
+    if lines:
+        typer.echo("\n".join(lines))
+
+
+def ensure_parent_dir(path: Path, dry_run: bool, ready: set[Path]) -> None:
+    # `ready` holds parents already handled this run, so siblings skip the
+    # stat (and a dry run prints each mkdir once).
     parent = path.parent
+    if parent in ready:
+        return
+    ready.add(parent)
     if parent.exists():
         return
     if dry_run:
@@ -141,23 +242,31 @@ def ensure_parent_dir(path: Path, dry_run: bool) -> None:
     parent.mkdir(parents=True, exist_ok=True)
 
 
-def backup_path_for(target: Path) -> Path:
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    return target.with_name(f"{target.name}.bak.{timestamp}")
+def backup_path_for(target: Path, timestamp: str) -> Path:
+    # A rename onto an earlier backup from the same second would clobber it.
+    backup = target.with_name(f"{target.name}.bak.{timestamp}")
+    n = 1
+    while os.path.lexists(backup):
+        backup = target.with_name(f"{target.name}.bak.{timestamp}-{n:02d}")
+        n += 1
+    return backup
 
 
-def remove_target(target: Path, mode: ReplaceMode, dry_run: bool) -> Path | None:
-    if not (target.exists() or target.is_symlink()):
+def remove_target(
+    target: Path, mode: ReplaceMode, dry_run: bool, timestamp: str,
+) -> Path | None:
+    st = _lstat_or_none(target)
+    if st is None:
         return None
 
-    if target.exists() and target.is_dir() and not target.is_symlink():
+    if stat.S_ISDIR(st.st_mode):
         raise typer.Exit(2)
 
     if mode == ReplaceMode.safe:
         return None
 
     if mode == ReplaceMode.backup:
-        backup = backup_path_for(target)
+        backup = backup_path_for(target, timestamp)
         if dry_run:
             typer.echo(
                 f"DRYRUN  mv {display_path(target)} {display_path(backup)}"
@@ -174,8 +283,8 @@ def remove_target(target: Path, mode: ReplaceMode, dry_run: bool) -> Path | None
     return None
 
 
-def create_link(item: LinkItem, dry_run: bool) -> None:
-    ensure_parent_dir(item.target, dry_run=dry_run)
+def create_link(item: LinkItem, dry_run: bool, ready: set[Path]) -> None:
+    ensure_parent_dir(item.target, dry_run=dry_run, ready=ready)
     if dry_run:
         typer.echo(
             f"DRYRUN  ln -s {display_path(item.source)} {display_path(item.target)}"
@@ -189,9 +298,14 @@ def link_items(
     mode: ReplaceMode,
     dry_run: bool,
 ) -> None:
+    items = list(items)
+    statuses = compute_statuses(items)
+    # One suffix for every backup made in this run.
+    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    ready_parents: set[Path] = set()
     had_errors = False
     for item in items:
-        status, detail = status_of(item)
+        status, detail = statuses[item.key]
         if status == "missing-source":
             typer.echo(
                 f"ERROR   {item.key:<22} source missing: {display_path(item.source)}"
@@ -209,20 +323,24 @@ def link_items(
             continue
 
         backup = None
-        if item.target.exists() or item.target.is_symlink():
+        if status != "absent":
             if mode == ReplaceMode.safe:
                 typer.echo(
                     f"SKIP    {item.key:<22} target exists (use --mode backup/force)"
                 )
                 continue
-            backup = remove_target(item.target, mode=mode, dry_run=dry_run)
+            backup = remove_target(
+                item.target, mode=mode, dry_run=dry_run, timestamp=timestamp,
+            )
 
         if backup and not dry_run:
             typer.echo(f"BACKUP  {item.key:<22} {display_path(backup)}")
 
-        create_link(item, dry_run=dry_run)
+        create_link(item, dry_run=dry_run, ready=ready_parents)
         action = "DRYRUN" if dry_run else "LINKED"
-        typer.echo(f"{action:<7} {item.key:<22} {link_target_summary(item)}")
+        typer.echo(_STATUS_FMT(
+            label=action, key=item.key, summary=link_target_summary(item), detail="",
+        ))
 
     if had_errors:
         raise typer.Exit(2)
@@ -1,27 +1,137 @@
 from __future__ import annotations
 
+import functools
+import json
+import os
 import platform
+import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.console import Console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
 
+json_loads: Callable[[bytes | str], Any]
+try:
+    # Optional: orjson parses these files several times faster. Its
+    # JSONDecodeError subclasses json.JSONDecodeError, so callers are
+    # unaffected.
+    from orjson import loads as json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    from json import loads as json_loads
 
-def repo_root() -> Path:
-    return Path(__file__).resolve().parents[2]
+REPO_ROOT = Path(__file__).resolve().parents[2]
+HOME = Path.home()
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+LINKS_JSON = SCRIPTS_DIR / "links.json"
+DEPS_JSON = SCRIPTS_DIR / "deps.json"
+DEFAULTS_JSON = SCRIPTS_DIR / "macos-defaults.json"
+JOBS_JSON = SCRIPTS_DIR / "jobs.json"
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or HOME / ".cache") / "settings-bootstrap"
+)
+VERIFY_CACHE = CACHE_DIR / "verify.json"
+
+# (rich-markup lines, ok count, fail count) for one verify section
+SectionResult = tuple[list[str], int, int]
+
+_HOME_STR = str(HOME)
+_HOME_PREFIX = _HOME_STR + os.sep
 
 
 def display_path(path: Path) -> str:
-    home = Path.home()
+    s = os.fspath(path)
+    if s.startswith(_HOME_PREFIX):
+        return "~/" + s[len(_HOME_PREFIX):]
+    if s == _HOME_STR:
+        return "~"
+    return s
+
+
+@functools.lru_cache(maxsize=None)
+def _read_bytes_cached(path_str: str, mtime_ns: int) -> bytes:
+    with open(path_str, "rb") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    return json_loads(_read_bytes_cached(path_str, mtime_ns))
+
+
+def read_bytes(path: Path) -> bytes:
+    return _read_bytes_cached(str(path), path.stat().st_mtime_ns)
+
+
+def load_json(path: Path) -> Any:
+    # Shared across callers: treat the result as read-only.
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
+def file_contains(path: Path, needle: bytes, limit: int = -1) -> bool:
+    # Reads at most `limit` bytes (all by default); missing files are False.
+    try:
+        with open(path, "rb") as f:
+            return needle in f.read(limit)
+    except OSError:
+        return False
+
+
+def file_stamp(*paths: Path) -> list[int] | None:
+    stamp: list[int] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp += (st.st_mtime_ns, st.st_size)
+    return stamp
+
+
+_verify_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _verify_cache() -> dict[str, Any]:
     try:
-        return f"~/{path.relative_to(home)}"
-    except ValueError:
-        return str(path)
+        data = json_loads(VERIFY_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def verify_cache_get(key: str) -> Any:
+    with _verify_cache_lock:
+        return _verify_cache().get(key)
+
+
+def verify_cache_put(key: str, value: Any) -> None:
+    # Best effort: a read-only or missing cache dir just means no reuse.
+    with _verify_cache_lock:
+        cache = _verify_cache()
+        if cache.get(key) == value:
+            return
+        cache[key] = value
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = VERIFY_CACHE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(cache, sort_keys=True))
+            os.replace(tmp, VERIFY_CACHE)
+        except OSError:
+            pass
+
+
+@functools.cache
+def get_console() -> Console:
+    from rich.console import Console
+
+    return Console()
 
 
 def require_darwin() -> None:
     if platform.system() != "Darwin":
-        console.print("[red]ERROR[/red]  This command only works on macOS")
+        get_console().print("[red]ERROR[/red]  This command only works on macOS")
         raise typer.Exit(1)
@@ -1,14 +1,45 @@
 from __future__ import annotations
 
+import functools
 import json
 import re
-from collections import defaultdict, deque
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import jsonschema
+from .utils import (
+    DEFAULTS_JSON,
+    DEPS_JSON,
+    JOBS_JSON,
+    LINKS_JSON,
+    REPO_ROOT,
+    SCRIPTS_DIR,
+    file_stamp,
+    load_json,
+    read_bytes,
+    verify_cache_get,
+    verify_cache_put,
+)
 
-from .utils import repo_root
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+
+_HARDCODED_PATH_RE = re.compile(rb"/(Users|home)/[^\s/]+")
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_schema(schema_path_str: str, mtime_ns: int) -> Validator:
+    # jsonschema is only needed by verify; keep it off other commands' startup.
+    from jsonschema.validators import validator_for
+
+    schema = load_json(Path(schema_path_str))
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _schema_validator(schema_path: Path) -> Validator:
+    return _compile_schema(str(schema_path), schema_path.stat().st_mtime_ns)
 
 
 def validate_json_schema(
@@ -21,21 +52,20 @@ def validate_json_schema(
     errors: list[str] = []
 
     try:
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(json_path)
     except (json.JSONDecodeError, OSError) as exc:
         return [f"cannot load {json_path.name}: {exc}"]
 
     try:
-        with open(schema_path, encoding="utf-8") as f:
-            schema = json.load(f)
+        validator = _schema_validator(schema_path)
     except (json.JSONDecodeError, OSError) as exc:
         return [f"cannot load schema: {exc}"]
 
-    try:
-        jsonschema.validate(data, schema)
-    except jsonschema.ValidationError as exc:
-        errors.append(exc.message)
+    from jsonschema.exceptions import best_match
+
+    error = best_match(validator.iter_errors(data))
+    if error is not None:
+        errors.append(error.message)
 
     if extra_validator and array_key:
         items = data.get(array_key)
@@ -45,66 +75,108 @@ def validate_json_schema(
     return errors
 
 
+def _unless_cached(
+    key: str, inputs: tuple[Path, ...], validate: Callable[[], list[str]]
+) -> list[str]:
+    # Only for checks that depend on nothing but their input files: a clean
+    # result is remembered across runs until an input (or this module) changes.
+    stamp = file_stamp(*inputs, Path(__file__))
+    if stamp is not None and verify_cache_get(key) == stamp:
+        return []
+    errors = validate()
+    if not errors and stamp is not None:
+        verify_cache_put(key, stamp)
+    return errors
+
+
+def _cyclic_components(graph: dict[str, set[str]]) -> list[list[str]]:
+    # Iterative Tarjan SCC. Every component with more than one node, or a
+    # node that depends on itself, is a cycle; overlapping cycles share one
+    # component, so nothing is hidden behind the first one found.
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[list[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in graph:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph[child])))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    if len(members) > 1 or node in graph[node]:
+                        components.append(sorted(members))
+    return sorted(components)
+
+
 def validate_deps_schema() -> list[str]:
     def _extra_validator(items: list, errors: list[str]) -> None:
-        all_labels = {
-            item["label"]
-            for item in items
-            if isinstance(item, dict) and "label" in item
-        }
+        graph: dict[str, set[str]] = {}
+        refs: list[tuple[int, str]] = []
         for i, item in enumerate(items):
             if not isinstance(item, dict):
                 continue
-            for dep in item.get("depends", []):
-                if dep not in all_labels:
-                    errors.append(
-                        f"checks[{i}].depends: unknown label '{dep}'"
-                    )
+            deps = item.get("depends", [])
+            refs.extend((i, dep) for dep in deps)
+            if "label" in item:
+                graph.setdefault(item["label"], set()).update(deps)
 
-        in_degree: dict[str, int] = defaultdict(int)
-        dependents: dict[str, list[str]] = defaultdict(list)
-        for item in items:
-            if not isinstance(item, dict) or "label" not in item:
-                continue
-            label = item["label"]
-            in_degree.setdefault(label, 0)
-            for dep in item.get("depends", []):
-                if dep in all_labels:
-                    dependents[dep].append(label)
-                    in_degree[label] += 1
-
-        queue: deque[str] = deque(
-            label for label, deg in in_degree.items() if deg == 0
-        )
-        visited = 0
-        while queue:
-            node = queue.popleft()
-            visited += 1
-            for child in dependents[node]:
-                in_degree[child] -= 1
-                if in_degree[child] == 0:
-                    queue.append(child)
-
-        if visited < len(in_degree):
-            cycle_members = sorted(
-                label for label, deg in in_degree.items() if deg > 0
-            )
+        for i, dep in refs:
+            if dep not in graph:
+                errors.append(f"checks[{i}].depends: unknown label '{dep}'")
+
+        for members in _cyclic_components(graph):
             errors.append(
-                f"dependency cycle detected among: {', '.join(cycle_members)}"
+                f"dependency cycle detected among: {', '.join(members)}"
             )
 
-    return validate_json_schema(
-        repo_root() / "scripts" / "deps.json",
-        repo_root() / "scripts" / "deps.schema.json",
-        array_key="checks",
-        extra_validator=_extra_validator,
+    schema_path = SCRIPTS_DIR / "deps.schema.json"
+    return _unless_cached(
+        "schema:deps",
+        (DEPS_JSON, schema_path),
+        lambda: validate_json_schema(
+            DEPS_JSON,
+            schema_path,
+            array_key="checks",
+            extra_validator=_extra_validator,
+        ),
     )
 
 
 def validate_defaults_schema() -> list[str]:
-    return validate_json_schema(
-        repo_root() / "scripts" / "macos-defaults.json",
-        repo_root() / "scripts" / "macos-defaults.schema.json",
+    schema_path = SCRIPTS_DIR / "macos-defaults.schema.json"
+    return _unless_cached(
+        "schema:macos-defaults",
+        (DEFAULTS_JSON, schema_path),
+        lambda: validate_json_schema(DEFAULTS_JSON, schema_path),
     )
 
 
@@ -141,13 +213,13 @@ def validate_links_schema() -> list[str]:
             else:
                 seen_targets[raw_target] = i
 
-            source_path = repo_root() / raw_source
+            source_path = REPO_ROOT / raw_source
             if raw_source and not (source_path.exists() or source_path.is_symlink()):
                 errors.append(f"links[{i}].source: source not found: {raw_source}")
 
     return validate_json_schema(
-        repo_root() / "scripts" / "links.json",
-        repo_root() / "scripts" / "links.schema.json",
+        LINKS_JSON,
+        SCRIPTS_DIR / "links.schema.json",
         array_key="links",
         extra_validator=_extra_validator,
     )
@@ -168,30 +240,60 @@ def validate_jobs_schema() -> list[str]:
                 seen[label] = i
 
             script = item.get("script", "")
-            if script and not (repo_root() / script).is_file():
+            if script and not (REPO_ROOT / script).is_file():
                 errors.append(f"jobs[{i}]: script not found: {script}")
 
     return validate_json_schema(
-        repo_root() / "scripts" / "jobs.json",
-        repo_root() / "scripts" / "jobs.schema.json",
+        JOBS_JSON,
+        SCRIPTS_DIR / "jobs.schema.json",
         array_key="jobs",
         extra_validator=_extra_validator,
     )
 
 
 def check_json_formatting(file_path: Path) -> bool:
-    with open(file_path, encoding="utf-8") as f:
-        raw = f.read()
-    data = json.loads(raw)
-    expected = json.dumps(data, indent=2) + "\n"
-    return raw == expected
+    errors = _unless_cached(
+        f"format:{file_path}",
+        (file_path,),
+        lambda: [] if _is_json_formatted(file_path) else [file_path.name],
+    )
+    return not errors
+
+
+def _is_json_formatted(file_path: Path) -> bool:
+    content = read_bytes(file_path)
+    # The encoder never emits raw tabs and we require a trailing newline,
+    # so either mismatch is decided without serializing anything.
+    if b"\t" in content or not content.endswith(b"\n"):
+        return False
+    raw = memoryview(content)
+    data = load_json(file_path)
+    pos = 0
+    for chunk in json.JSONEncoder(indent=2).iterencode(data):
+        encoded = chunk.encode("utf-8")
+        end = pos + len(encoded)
+        if raw[pos:end] != encoded:
+            return False
+        pos = end
+    return raw[pos:] == b"\n"
 
 
 def check_hardcoded_paths(file_path: Path) -> list[tuple[int, str]]:
-    regex = re.compile(r"/(Users|home)/[^\s/]+")
+    # Scan the raw bytes in one pass and only decode the offending lines.
+    data = read_bytes(file_path)
     violations: list[tuple[int, str]] = []
-    with open(file_path, encoding="utf-8", errors="ignore") as f:
-        for lineno, line in enumerate(f, start=1):
-            if regex.search(line):
-                violations.append((lineno, line.rstrip()))
+    lineno = 1
+    pos = 0
+    line_end = -1
+    for m in _HARDCODED_PATH_RE.finditer(data):
+        if m.start() <= line_end:
+            continue
+        line_start = data.rfind(b"\n", 0, m.start()) + 1
+        lineno += data.count(b"\n", pos, line_start)
+        pos = line_start
+        line_end = data.find(b"\n", m.end())
+        if line_end == -1:
+            line_end = len(data)
+        line = data[line_start:line_end].decode("utf-8", errors="ignore")
+        violations.append((lineno, line.rstrip()))
     return violations